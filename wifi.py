@@ -1,203 +1,426 @@
 import subprocess
 import time
 import os
+import sys
 import platform
-from collections import defaultdict, deque
-from colorama import init, Fore, Style
-from tabulate import tabulate
+import queue
+import signal as _signal  # Aliased: 'signal' is used throughout for signal strength
+import threading
+import re
+import pickle
+import mmap
+from collections import namedtuple
+from operator import attrgetter
+import numpy as np
 
-# Initialize Colorama
-init()
+try:
+    from wcwidth import wcswidth  # Optional: measures wide CJK/emoji characters in SSIDs correctly
+except ImportError:
+    wcswidth = None
+
+# POSIX terminals understand ANSI escapes natively; only the Windows console needs colorama
+if sys.platform == 'win32':
+    from colorama import just_fix_windows_console
+    just_fix_windows_console()
+
+# ANSI color escapes
+GREEN = '\x1b[32m'
+YELLOW = '\x1b[33m'
+LIGHT_YELLOW = '\x1b[93m'
+RED = '\x1b[31m'
+RESET = '\x1b[0m'
 
 OUI_FILE = 'manuf'  # The downloaded Wireshark OUI file name
+OUI_CACHE_SUFFIX = '.pkl'  # Sidecar holding the parsed OUI database
 MAX_HISTORY = 10    # Maximum number of historical points to track for RSSI
+REFRESH_INTERVAL = 5  # Seconds between table refreshes
+MAX_REFRESH_INTERVAL = 60  # Longest interval to back off to while scans stay unchanged
+BACKOFF_AFTER = 3   # Unchanged scans before each doubling of the interval
+WAIT_SLICE = 0.25   # Longest single wait, so Ctrl-C is noticed quickly on every platform
+MAX_APS = 512       # Initial number of access points the RSSI ring buffer has rows for
+
+# Matches "XX:XX:XX<ws>short-name<ws>full vendor name" rows in the manuf file
+OUI_LINE_RE = re.compile(rb'(?m)^([0-9A-F:]{8})[ \t]+\S+[ \t]+([^\r\n]+)')
+
+# Matches the "SSID 1 : name", "BSSID 1 : mac", "Signal : 80%" and "Channel : 6" lines of netsh output
+NETSH_LINE_RE = re.compile(r'^\s*(SSID|BSSID|Signal|Channel)(?:\s+\d+)?\s*:\s*(.*?)\s*$')
+
+# One scanned access point; plain tuples are cheaper to build, sort and hash than dicts.
+# oui is the normalized BSSID prefix, computed once when the scan is parsed
+Network = namedtuple('Network', ['ssid', 'bssid', 'signal', 'channel', 'oui'])
+by_signal = attrgetter('signal')
+
+# Ring buffer of historical RSSI values: one row per BSSID, plus each row's write position and fill count
+rssi_history = np.zeros((MAX_APS, MAX_HISTORY), dtype=np.int8)
+rssi_heads = np.zeros(MAX_APS, dtype=np.uint8)
+rssi_counts = np.zeros(MAX_APS, dtype=np.uint8)
+rssi_rows = {}  # BSSID -> row in rssi_history
 
-# Dictionary to store historical RSSI values
-rssi_history = defaultdict(lambda: deque(maxlen=MAX_HISTORY))
+# Table layout, and the row lists reused across refreshes
+TABLE_HEADERS = ['No.', 'SSID', 'BSSID', 'Signal Strength', 'Channel', 'Manufacturer', 'RSSI History']
+TABLE_ALIGN = ['>', '<', '<', '<', '>', '<', '<']
+HISTORY_WIDTH = max(len(TABLE_HEADERS[-1]), MAX_HISTORY)  # The graph column never grows past this
+table_rows = []  # [No., SSID, BSSID, signal text, channel, manufacturer, padded graph, signal color]
+table_widths = [len(header) for header in TABLE_HEADERS[:-1]] + [HISTORY_WIDTH]
+table_layout = None  # Borders and row template for table_widths, see build_table_layout
+
+CLEAR_SCREEN = '\x1b[2J\x1b[H'  # ANSI erase display + cursor home
+last_scan_hash = None  # Hash of the last rendered scan, to skip identical redraws
 
 def load_oui_database(oui_file):
-    """Load the OUI database from the given file into a dictionary."""
-    oui_dict = {}
+    """Load the OUI database from the given file into sorted NumPy arrays.
+
+    Returns a (keys, vals) pair: keys is a sorted |S8 array of MAC prefixes
+    and vals holds the matching manufacturer names, so lookups can use
+    np.searchsorted instead of a Python dict. The parsed arrays are cached
+    in a pickle next to the file and reused while it is newer than the file.
+    """
+    cache_file = oui_file + OUI_CACHE_SUFFIX
     try:
-        with open(oui_file, 'r') as file:
-            for line in file:
-                # Skip comments and empty lines
-                if line.startswith('#') or not line.strip():
-                    continue
+        if os.path.getmtime(cache_file) >= os.path.getmtime(oui_file):
+            with open(cache_file, 'rb') as file:
+                keys, vals = pickle.load(file)
+            print(f"Loaded {len(keys)} entries from OUI cache.")
+            return keys, vals
+    except Exception:
+        pass  # Missing or unreadable cache, fall back to parsing
 
-                # Split the line by whitespace
-                parts = line.split()
-                if len(parts) >= 3:
-                    mac_prefix = parts[0].strip()  # MAC address prefix
-                    short_name = parts[1].strip()   # Shortened name (not used here)
-                    manufacturer = ' '.join(parts[2:]).strip()  # Full manufacturer name
-                    oui_dict[mac_prefix] = manufacturer
-        print(f"Loaded {len(oui_dict)} entries from OUI database.")
+    keys = np.array([], dtype='|S8')
+    vals = np.array([], dtype=object)
+    try:
+        # Scan the memory-mapped file directly instead of copying it into a bytes object first.
+        # Only 24-bit "XX:XX:XX" blocks are matched; comments never start with a hex digit
+        with open(oui_file, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            entries = OUI_LINE_RE.findall(data)
+        if entries:
+            keys = np.array([prefix for prefix, _ in entries], dtype='|S8')
+            vals = np.array([name.strip().decode('utf-8', 'replace') for _, name in entries], dtype=object)
+            order = keys.argsort(kind='stable')
+            keys = keys[order]
+            vals = vals[order]
+        print(f"Loaded {len(keys)} entries from OUI database.")
+
+        try:
+            with open(cache_file, 'wb') as file:
+                pickle.dump((keys, vals), file, protocol=5)
+        except OSError as e:
+            print(f"Could not write OUI cache: {e}")
     except Exception as e:
         print(f"Error loading OUI database: {e}")
-    return oui_dict
+    return keys, vals
+
+def _oui_prefix(mac):
+    """Return the normalized first three bytes of a MAC address as bytes, e.g. b'00:1A:2B'."""
+    if len(mac) >= 8 and mac[2] == ':' and mac[5] == ':':
+        return mac[:8].upper().encode()  # Colons already sit at fixed positions
+    return ':'.join(mac.split(':')[:3]).upper().encode()  # Get the first three bytes of the MAC address
+
+def get_manufacturers(prefixes, oui_db):
+    """Fetch the manufacturers for a list of OUI prefixes (as from _oui_prefix) with a single vectorized binary search."""
+    keys, vals = oui_db
+    if not prefixes or not len(keys):
+        return ['Unknown Manufacturer'] * len(prefixes)
 
-def get_manufacturer(mac, oui_dict):
-    """Fetch the manufacturer information based on MAC address using a local OUI database."""
-    # Normalize the MAC address and get the first three bytes
-    mac_prefix = ':'.join(mac.split(':')[:3]).upper()  # Get the first three bytes of the MAC address
-    return oui_dict.get(mac_prefix, 'Unknown Manufacturer')
+    prefixes = np.array(prefixes, dtype='|S8')
+    idx = np.minimum(np.searchsorted(keys, prefixes), len(keys) - 1)
+    hit = keys[idx] == prefixes
+    return np.where(hit, vals[idx], 'Unknown Manufacturer').tolist()
+
+# Color for every signal percentage 0-100: weak (<=30), fair (<=50), good (<=70), strong
+SIGNAL_COLORS = [RED] * 31 + [LIGHT_YELLOW] * 20 + [YELLOW] * 20 + [GREEN] * 30
+
+# Pre-formatted history graph block for every signal percentage; no signal is drawn as a blank
+SIGNAL_BLOCKS = [" "] + [f"{color}█{RESET}" for color in SIGNAL_COLORS[1:]]
+
+def _signal_index(signal):
+    """Clamp a signal percentage to 0-100 for indexing SIGNAL_COLORS and SIGNAL_BLOCKS."""
+    return max(0, min(100, signal))
 
 def get_color_for_signal(signal):
     """Return color based on signal strength."""
-    if signal > 70:
-        return Fore.GREEN  # Strong Signal
-    elif signal > 50:
-        return Fore.YELLOW  # Good Signal
-    elif signal > 30:
-        return Fore.LIGHTYELLOW_EX  # Fair Signal
-    else:
-        return Fore.RED  # Weak Signal
+    return SIGNAL_COLORS[_signal_index(signal)]
 
-def get_colored_block(signal):
-    """Return a colored block based on signal strength."""
-    color = get_color_for_signal(signal)
-    return f"{color}█{Style.RESET_ALL}" if signal > 0 else " "
+def record_rssi(bssid, signal):
+    """Store a signal sample in the BSSID's ring buffer row and return its history, oldest first."""
+    global rssi_history, rssi_heads, rssi_counts
+    row = rssi_rows.setdefault(bssid, len(rssi_rows))
+    if row >= len(rssi_history):
+        # More access points than rows, double the buffer
+        extra = len(rssi_history)
+        rssi_history = np.vstack((rssi_history, np.zeros((extra, MAX_HISTORY), dtype=np.int8)))
+        rssi_heads = np.concatenate((rssi_heads, np.zeros(extra, dtype=np.uint8)))
+        rssi_counts = np.concatenate((rssi_counts, np.zeros(extra, dtype=np.uint8)))
+
+    head = rssi_heads[row]
+    rssi_history[row, head] = signal
+    rssi_heads[row] = (head + 1) % MAX_HISTORY
+    rssi_counts[row] = min(rssi_counts[row] + 1, MAX_HISTORY)
+
+    # Rotate so the oldest sample comes first, then keep only the filled slots
+    return np.roll(rssi_history[row], -int(rssi_heads[row]))[MAX_HISTORY - rssi_counts[row]:].tolist()
 
 def generate_signal_graph(rssi_values):
     """Generate a simple ASCII graph for signal strength history with colors."""
     if not rssi_values:
         return " " * MAX_HISTORY  # Empty history graph
 
-    graph = ""
-    for value in rssi_values:
-        graph += get_colored_block(value)
-
-    return graph
+    return ''.join([SIGNAL_BLOCKS[_signal_index(value)] for value in rssi_values])
 
-def list_and_sort_wifi_networks_linux(oui_dict):
+def list_and_sort_wifi_networks_linux(oui_db):
     """List and sort Wi-Fi networks for Linux using nmcli."""
     try:
-        result = subprocess.run(['nmcli', '-f', 'SSID,BSSID,SIGNAL,CHAN', 'dev', 'wifi'], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            output = result.stdout.splitlines()
+        # Terse mode prints one colon-separated row per network with no header or column padding.
+        # Escaping is off, so split from the right: CHAN and SIGNAL, then the six BSSID octets, leave the SSID intact.
+        with subprocess.Popen(['nmcli', '-t', '-e', 'no', '-f', 'SSID,BSSID,SIGNAL,CHAN', 'dev', 'wifi'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1) as proc:
             networks = []
-            for line in output[1:]:
-                if line.strip():
-                    parts = [p.strip() for p in line.split() if p]
-                    if len(parts) >= 4:
-                        ssid = parts[0]
-                        bssid = parts[1]
-                        try:
-                            signal = int(parts[2])
-                        except ValueError:
-                            signal = 0
-                        channel = parts[3]
-                        networks.append({'SSID': ssid, 'BSSID': bssid, 'SIGNAL': signal, 'CHANNEL': channel})
-
-            return sorted(networks, key=lambda x: x['SIGNAL'], reverse=True)
+            for line in proc.stdout:
+                fields = line.rstrip('\n').rsplit(':', 8)
+                if len(fields) == 9:
+                    ssid = fields[0]
+                    bssid = sys.intern(':'.join(fields[1:7]))  # Interned so RSSI history lookups hit the same key object
+                    try:
+                        signal = int(fields[7])
+                    except ValueError:
+                        signal = 0
+                    channel = fields[8]
+                    networks.append(Network(ssid, bssid, signal, channel, _oui_prefix(bssid)))
+
+        if proc.returncode == 0:
+            return sorted(networks, key=by_signal, reverse=True)
 
     except Exception as e:
         print(f"An error occurred: {e}")
     return []
 
-def list_and_sort_wifi_networks_macos(oui_dict):
+def list_and_sort_wifi_networks_macos(oui_db):
     """List and sort Wi-Fi networks for macOS using airport."""
     try:
-        result = subprocess.run(['/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport', '-s'], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            output = result.stdout.splitlines()
+        with subprocess.Popen(['/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport', '-s'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1) as proc:
             networks = []
-            for line in output[1:]:
-                if line.strip():
-                    parts = line.split()
-                    ssid = parts[0]
-                    bssid = parts[1]
-                    signal = int(parts[2])
-                    channel = parts[3] if len(parts) > 3 else 'N/A'
-                    networks.append({'SSID': ssid, 'BSSID': bssid, 'SIGNAL': signal, 'CHANNEL': channel})
+            next(proc.stdout, None)  # Skip the header row
+            for line in proc.stdout:
+                # Only the first four columns are used, leave the rest of the line unsplit
+                parts = line.split(None, 4)
+                if len(parts) < 3:
+                    continue  # Blank or truncated line
+                ssid = parts[0]
+                bssid = sys.intern(parts[1])
+                signal = int(parts[2])
+                channel = parts[3] if len(parts) > 3 else 'N/A'
+                networks.append(Network(ssid, bssid, signal, channel, _oui_prefix(bssid)))
 
-            return sorted(networks, key=lambda x: x['SIGNAL'], reverse=True)
+        if proc.returncode == 0:
+            return sorted(networks, key=by_signal, reverse=True)
 
     except Exception as e:
         print(f"An error occurred: {e}")
     return []
 
-def list_and_sort_wifi_networks_windows(oui_dict):
+def list_and_sort_wifi_networks_windows(oui_db):
     """List and sort Wi-Fi networks for Windows using netsh."""
     try:
-        result = subprocess.run(['netsh', 'wlan', 'show', 'network'], capture_output=True, text=True)
-
-        if result.returncode == 0:
-            output = result.stdout.splitlines()
+        # mode=Bssid lists every access point of each SSID in a single netsh call
+        with subprocess.Popen(['netsh', 'wlan', 'show', 'network', 'mode=Bssid'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1) as proc:
             networks = []
             ssid, bssid, signal, channel = None, None, None, None
-            
-            for line in output:
-                line = line.strip()
-                if line.startswith("SSID"):
-                    ssid = line.split(":")[1].strip()
-                elif line.startswith("BSSID"):
-                    bssid = line.split(":")[1].strip()
-                elif line.startswith("Signal"):
-                    signal = int(line.split(":")[1].strip().replace('%', ''))
-                elif line.startswith("Channel"):
-                    channel = line.split(":")[1].strip()
-                    networks.append({'SSID': ssid, 'BSSID': bssid, 'SIGNAL': signal, 'CHANNEL': channel})
-
-            return sorted(networks, key=lambda x: x['SIGNAL'], reverse=True)
+
+            for line in proc.stdout:
+                match = NETSH_LINE_RE.match(line)
+                if not match:
+                    continue
+                key, value = match.groups()
+                if key == "SSID":
+                    ssid = value
+                elif key == "BSSID":
+                    bssid = sys.intern(value)
+                elif key == "Signal":
+                    signal = int(value.rstrip('%'))
+                else:  # Channel closes the BSSID block
+                    channel = value
+                    networks.append(Network(ssid, bssid, signal, channel, _oui_prefix(bssid)))
+
+        if proc.returncode == 0:
+            return sorted(networks, key=by_signal, reverse=True)
 
     except Exception as e:
         print(f"An error occurred: {e}")
     return []
 
-def list_and_sort_wifi_networks(oui_dict):
+def list_and_sort_wifi_networks(oui_db):
     """Detect the operating system and list Wi-Fi networks accordingly."""
     system = platform.system()
     
     if system == "Linux":
-        return list_and_sort_wifi_networks_linux(oui_dict)
+        return list_and_sort_wifi_networks_linux(oui_db)
     elif system == "Darwin":  # macOS
-        return list_and_sort_wifi_networks_macos(oui_dict)
+        return list_and_sort_wifi_networks_macos(oui_db)
     elif system == "Windows":
-        return list_and_sort_wifi_networks_windows(oui_dict)
+        return list_and_sort_wifi_networks_windows(oui_db)
     else:
         print("Unsupported operating system.")
         return []
 
-def display_wifi_networks(oui_dict):
-    """Display the detected Wi-Fi networks in a formatted table."""
-    networks = list_and_sort_wifi_networks(oui_dict)
-    
-    # Prepare the table data
-    table_data = []
-    for index, network in enumerate(networks):
-        manufacturer = get_manufacturer(network['BSSID'], oui_dict)
-        color = get_color_for_signal(network['SIGNAL'])
-        colored_signal = f"{color}{network['SIGNAL']}%{Style.RESET_ALL}"
-        
+def scan_wifi_networks_forever(oui_db, scan_requested, results):
+    """Scan in a background thread each time scan_requested is set, handing the result to the display loop.
+
+    results is a Queue with maxsize=1 that only ever holds the newest scan, so
+    the display loop never renders a result that was queued behind another.
+    """
+    while True:
+        scan_requested.wait()
+        scan_requested.clear()
+        networks = list_and_sort_wifi_networks(oui_db)
+
+        # Replace a result the display loop hasn't picked up yet; this is the only producer, so put() never blocks
+        try:
+            results.get_nowait()
+        except queue.Empty:
+            pass
+        results.put(networks)
+
+def wait_for_scan(results, stop_event):
+    """Wait for the next background scan result, returning None if stop_event is set first."""
+    while not stop_event.is_set():
+        try:
+            return results.get(timeout=WAIT_SLICE)
+        except queue.Empty:
+            pass
+    return None
+
+def wait_until(deadline, stop_event):
+    """Sleep until the time.monotonic() deadline, returning early if stop_event is set.
+
+    Waits in short slices because a lock wait isn't interrupted by Ctrl-C on Windows.
+    """
+    while not stop_event.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        stop_event.wait(min(remaining, WAIT_SLICE))
+
+def text_width(text):
+    """Return how many terminal cells text takes up; wide CJK and emoji characters count as two."""
+    if wcswidth is not None:
+        width = wcswidth(text)
+        if width >= 0:
+            return width
+    return len(text)  # No wcwidth, or text with control characters it can't measure
+
+def pad_cell(text, text_cells, width, align):
+    """Pad text that takes up text_cells terminal cells to width, on the side given by align."""
+    padding = ' ' * (width - text_cells)
+    return padding + text if align == '>' else text + padding
+
+def build_table_layout(widths):
+    """Pre-render the fancy_grid style borders, header and row template for the given column widths.
+
+    Returns (top, header, header_rule, row_rule, bottom, row_format). row_format takes the
+    six already padded text cells followed by the padded graph and the signal color; the
+    color is applied outside the padding, so escape codes never count towards the column width.
+    """
+    def rule(left, fill, mid, right):
+        return left + mid.join(fill * (width + 2) for width in widths) + right
+
+    header = '│ ' + ' │ '.join(pad_cell(text, text_width(text), width, align) for text, align, width in zip(TABLE_HEADERS, TABLE_ALIGN, widths)) + ' │'
+    row_format = '│ {0} │ {1} │ {2} │ {7}{3}' + RESET + ' │ {4} │ {5} │ {6} │'
+    return (rule('╒', '═', '╤', '╕'), header, rule('╞', '═', '╪', '╡'),
+            rule('├', '─', '┼', '┤'), rule('╘', '═', '╧', '╛'), row_format)
+
+def display_wifi_networks(networks, oui_db):
+    """Display the detected Wi-Fi networks in a formatted table.
+
+    Returns False without redrawing if the scan matches the previous one, True otherwise.
+    """
+    global last_scan_hash, table_layout
+
+    # Nothing to redraw if the scan matches the previous one
+    scan_hash = hash(tuple(networks))
+    if scan_hash == last_scan_hash:
+        return False
+    last_scan_hash = scan_hash
+
+    # Resolve all manufacturers at once
+    manufacturers = get_manufacturers([network.oui for network in networks], oui_db)
+
+    # Reuse the row lists from the previous refresh, growing or shrinking to the number of networks
+    del table_rows[len(networks):]
+    while len(table_rows) < len(networks):
+        table_rows.append([str(len(table_rows) + 1)] + [None] * 7)
+
+    # Fill in the table data
+    for row, network, manufacturer in zip(table_rows, networks, manufacturers):
         # Update the historical RSSI data
-        rssi_history[network['BSSID']].append(network['SIGNAL'])
+        history = record_rssi(network.bssid, network.signal)
         
-        # Generate the signal history graph
-        signal_graph = generate_signal_graph(rssi_history[network['BSSID']])
+        # Generate the signal history graph, padded by hand since its escape codes have no width
+        signal_graph = generate_signal_graph(history) + ' ' * (HISTORY_WIDTH - len(history))
         
-        # Append data to table
-        table_data.append([index + 1, network['SSID'], network['BSSID'], colored_signal, network['CHANNEL'], manufacturer, signal_graph])
+        # Update the row in place; column 0 is the fixed row number
+        row[1] = network.ssid
+        row[2] = network.bssid
+        row[3] = f"{network.signal}%"
+        row[4] = network.channel
+        row[5] = manufacturer
+        row[6] = signal_graph
+        row[7] = get_color_for_signal(network.signal)
 
-    # Define the table headers
-    headers = ['No.', 'SSID', 'BSSID', 'Signal Strength', 'Channel', 'Manufacturer', 'RSSI History']
-    
-    # Clear the screen before printing
-    os.system('clear' if os.name == 'posix' else 'cls')
+    # Measure in terminal cells, not code points, so wide characters in SSIDs keep the borders aligned
+    cell_widths = [[text_width(row[col]) for col in range(6)] for row in table_rows]
+
+    # Columns only ever widen, so the layout is rebuilt only when a longer value shows up
+    widths = [max(table_widths[col], max((cells[col] for cells in cell_widths), default=0)) for col in range(6)]
+    widths.append(HISTORY_WIDTH)
+    if widths != table_widths or table_layout is None:
+        table_widths[:] = widths
+        table_layout = build_table_layout(table_widths)
+    top, header, header_rule, row_rule, bottom, row_format = table_layout
 
-    # Print the table using tabulate
-    print(tabulate(table_data, headers=headers, tablefmt='fancy_grid'))
+    rendered_rows = []
+    for row, cells in zip(table_rows, cell_widths):
+        padded = [pad_cell(row[col], cells[col], widths[col], TABLE_ALIGN[col]) for col in range(6)]
+        rendered_rows.append(row_format.format(*padded, row[6], row[7]))
+
+    # Clear the screen and print the whole table with a single write
+    lines = [CLEAR_SCREEN + top, header]
+    if table_rows:
+        lines.append(header_rule)
+        lines.append(('\n' + row_rule + '\n').join(rendered_rows))
+    lines.append(bottom)
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+    return True
 
 # Load the OUI database from the local file
-oui_dict = load_oui_database(OUI_FILE)
+oui_db = load_oui_database(OUI_FILE)
 
-# Continuously refresh the network list
-try:
-    while True:
-        display_wifi_networks(oui_dict)
-        time.sleep(5)  # Update interval in seconds
-except KeyboardInterrupt:
-    print("\nExiting...")
+# Scan in a background thread so Ctrl-C is still handled while nmcli/netsh/airport is running
+scan_requested = threading.Event()
+scan_results = queue.Queue(maxsize=1)
+threading.Thread(target=scan_wifi_networks_forever, args=(oui_db, scan_requested, scan_results), daemon=True).start()
+
+# Ctrl-C sets the stop event so every wait below returns immediately
+stop_event = threading.Event()
+_signal.signal(_signal.SIGINT, lambda signum, frame: stop_event.set())
+
+# Continuously refresh the network list on a fixed schedule, regardless of how long each scan takes
+next_refresh = time.monotonic()
+unchanged_scans = 0
+interval = REFRESH_INTERVAL
+while not stop_event.is_set():
+    # Scan at the deadline itself, so the table and the backoff below always see current data
+    scan_requested.set()
+    networks = wait_for_scan(scan_results, stop_event)
+    if networks is None:
+        break
+
+    # Back off while the scans keep coming back identical: double the interval every few unchanged scans
+    if display_wifi_networks(networks, oui_db):
+        unchanged_scans = 0
+    elif interval < MAX_REFRESH_INTERVAL:
+        unchanged_scans += 1
+    interval = min(MAX_REFRESH_INTERVAL, REFRESH_INTERVAL * 2 ** (unchanged_scans // BACKOFF_AFTER))
+
+    # Don't try to catch up on missed refreshes if the scanner fell behind
+    next_refresh = max(next_refresh + interval, time.monotonic())
+    wait_until(next_refresh, stop_event)
+print("\nExiting...")